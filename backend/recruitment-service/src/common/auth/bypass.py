@@ -0,0 +1,20 @@
+import hmac
+from typing import Optional
+
+from src.common.config import settings
+
+# Development bypass settings, resolved once at import since they cannot
+# change at runtime
+BYPASS_ALLOWED = settings.ENVIRONMENT in ("development", "testing") and settings.AUTH_BYPASS_ENABLED
+_BYPASS_TOKEN = settings.AUTH_BYPASS_TOKEN.encode()
+
+# Claims for bypassed requests; shared, so callers must copy before adding fields
+BYPASS_USER_CLAIMS = {
+    "sub": "test-user-id",
+    "name": "Test User",
+    "roles": ["admin"],
+}
+
+def is_valid_bypass(token: Optional[str]) -> bool:
+    """Return True if the development bypass is enabled and the token matches."""
+    return bool(BYPASS_ALLOWED and token and hmac.compare_digest(token.encode(), _BYPASS_TOKEN))
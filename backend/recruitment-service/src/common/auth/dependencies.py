@@ -1,8 +1,12 @@
+import logging
 from fastapi import Depends, HTTPException, Request, status, Header
+from fastapi.security import SecurityScopes
 from typing import Dict, Optional, Any
 from fastapi_azure_auth import B2CMultiTenantAuthorizationCodeBearer
 from fastapi_azure_auth.user import User
 
+from src.common.auth.bypass import BYPASS_ALLOWED, BYPASS_USER_CLAIMS, is_valid_bypass
+from src.common.auth.token_cache import TokenCache
 from src.common.config import settings
 from src.common.logging import get_logger
 
@@ -13,8 +17,8 @@ logger = get_logger(__name__)
 azure_scheme = B2CMultiTenantAuthorizationCodeBearer(
     app_client_id=settings.AZURE_AD_B2C_CLIENT_ID,
     openid_config_url=settings.openid_config_url,
-    openapi_authorization_url=f'https://{settings.AZURE_AD_B2C_TENANT_NAME}.b2clogin.com/{settings.AZURE_AD_B2C_TENANT_NAME}.onmicrosoft.com/{settings.AZURE_AD_B2C_SIGNIN_POLICY}/oauth2/v2.0/authorize',
-    openapi_token_url=f'https://{settings.AZURE_AD_B2C_TENANT_NAME}.b2clogin.com/{settings.AZURE_AD_B2C_TENANT_NAME}.onmicrosoft.com/{settings.AZURE_AD_B2C_SIGNIN_POLICY}/oauth2/v2.0/token',
+    openapi_authorization_url=settings.authorization_url,
+    openapi_token_url=settings.token_url,
     scopes={
         "openid": "OpenID Connect authentication",
         settings.azure_ad_b2c_scope: "Access API"
@@ -22,34 +26,73 @@ azure_scheme = B2CMultiTenantAuthorizationCodeBearer(
     validate_iss=False,
 )
 
+# Recently validated B2C users, so repeat requests with the same bearer token
+# skip signature validation until the cache TTL or the token's expiry
+token_cache = TokenCache(
+    maxsize=settings.AUTH_TOKEN_CACHE_MAX_SIZE,
+    ttl=settings.AUTH_TOKEN_CACHE_TTL_SECONDS,
+)
+
+async def get_b2c_user(request: Request, security_scopes: SecurityScopes) -> Optional[User]:
+    """
+    Validate the request's bearer token with Azure AD B2C, reusing cached results.
+    
+    Args:
+        request: The HTTP request
+        security_scopes: Scopes required by the endpoint
+        
+    Returns:
+        The validated B2C user, or None for a valid development bypass
+    """
+    # A bypassed request has no bearer token; skip B2C validation, which
+    # would otherwise reject it before get_current_user sees the bypass
+    if is_valid_bypass(request.headers.get("X-Auth-Bypass")):
+        return None
+    
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    # Endpoints requiring specific scopes always get a full validation
+    if scheme.lower() != "bearer" or not token or security_scopes.scopes:
+        token = None
+    
+    if token:
+        user = token_cache.get(token)
+        if user is not None:
+            request.state.user = user
+            return user
+    
+    user = await azure_scheme(request, security_scopes)
+    if user and token:
+        token_cache.set(token, user, exp=user.claims.get("exp"))
+    return user
+
 async def get_current_user(
     request: Request,
-    user: Optional[User] = Depends(azure_scheme),
+    user: Optional[User] = Depends(get_b2c_user),
     x_auth_bypass: Optional[str] = Header(None)
 ) -> Dict[str, Any]:
     """
     Get current authenticated user from Azure AD B2C or development bypass.
     """
-    logger.debug("Auth attempt", 
-               path=request.url.path,
-               has_auth_bypass=bool(x_auth_bypass))
+    path = request.url.path
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Auth attempt", 
+                   path=path,
+                   has_auth_bypass=bool(x_auth_bypass))
     
     # Development bypass for testing
-    if settings.ENVIRONMENT in ["development", "testing"] and settings.AUTH_BYPASS_ENABLED:
-        if x_auth_bypass == settings.AUTH_BYPASS_TOKEN:
-            logger.info("Auth bypass successful", path=request.url.path)
+    if BYPASS_ALLOWED and x_auth_bypass:
+        if is_valid_bypass(x_auth_bypass):
+            logger.info("Auth bypass successful", path=path)
             return {
-                "sub": "test-user-id",
-                "name": "Test User",
-                "roles": ["admin"],
+                **BYPASS_USER_CLAIMS,
                 "tenant_id": request.headers.get("X-Test-Tenant-ID", "default-tenant")
             }
-        elif x_auth_bypass:
-            logger.warning("Invalid auth bypass token", path=request.url.path)
+        else:
+            logger.warning("Invalid auth bypass token", path=path)
     
     # Azure AD B2C authentication
     if user:
-        logger.info("B2C auth successful", user_id=user.claims.get("sub", "unknown"), path=request.url.path)
+        logger.info("B2C auth successful", user_id=user.claims.get("sub", "unknown"), path=path)
         return {
             "sub": user.claims.get("sub"),
             "name": user.claims.get("name"),
@@ -60,7 +103,7 @@ async def get_current_user(
         }
     
     # Authentication failed
-    logger.warning("Authentication failed - no valid credentials", path=request.url.path)
+    logger.warning("Authentication failed - no valid credentials", path=path)
     
     raise HTTPException(
         status_code=401,
@@ -0,0 +1,78 @@
+import hashlib
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class TokenCache:
+    """
+    In-process cache of successfully validated access tokens.
+
+    Entries are keyed by a truncated SHA-256 digest of the raw token, so the
+    token itself is never held in memory, and expire after the configured TTL
+    or at the token's own ``exp`` claim, whichever comes first. Only store
+    successful validations so a rejected token is always re-checked.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """Initialize the cache with a size bound and a TTL in seconds."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: Dict[bytes, Tuple[Any, float]] = {}
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        """Return the cache key for a raw token."""
+        return hashlib.sha256(token.encode()).digest()[:16]
+
+    def get(self, token: str) -> Optional[Any]:
+        """
+        Return the cached validation result for a token.
+
+        Args:
+            token: The raw access token
+
+        Returns:
+            The cached value, or None if absent or expired
+        """
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at <= time.time():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, token: str, value: Any, exp: Optional[float] = None) -> None:
+        """
+        Cache the validation result for a token.
+
+        Args:
+            token: The raw access token
+            value: The validated user or payload to cache
+            exp: The token's ``exp`` claim (epoch seconds), if any
+        """
+        now = time.time()
+        expires_at = now + self.ttl
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        if expires_at <= now:
+            return
+
+        if len(self._entries) >= self.maxsize:
+            self._evict(now)
+        self._entries[self._key(token)] = (value, expires_at)
+
+    def invalidate(self, token: str) -> None:
+        """Remove a token from the cache, e.g. after it has been revoked."""
+        self._entries.pop(self._key(token), None)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, clearing everything if the cache is still full."""
+        expired = [key for key, (_, expires_at) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        if len(self._entries) >= self.maxsize:
+            self._entries.clear()
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List, Optional, Union
 
@@ -19,11 +20,15 @@ class Settings(BaseSettings):
     ENVIRONMENT: str = "development"  # development, testing, production
     LOG_LEVEL: str = "DEBUG"  # DEBUG, INFO, WARNING, ERROR, CRITICAL
     LOG_FORMAT: str = "json"  # json or console
+    LOG_SAMPLE_RATE: float = 1.0  # Fraction of DEBUG/INFO records kept; warnings and errors are always logged
+    LOG_MAX_RATE_PER_SECOND: float = 0  # Cap on log records written per second; 0 disables the limit
     
     # Security
     AUTH_SECRET_KEY: str = "default-dev-key-replace-in-production"
     AUTH_ALGORITHM: str = "HS256"
     AUTH_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    AUTH_TOKEN_CACHE_TTL_SECONDS: int = 30  # How long a validated token is trusted without re-validation
+    AUTH_TOKEN_CACHE_MAX_SIZE: int = 10000
     
     # Auth bypass config for development/testing
     AUTH_BYPASS_ENABLED: bool = True
@@ -73,6 +78,16 @@ class Settings(BaseSettings):
         """Return the OpenID configuration URL for Azure AD B2C."""
         return f"{self.authority_url}/v2.0/.well-known/openid-configuration"
     
+    @property
+    def authorization_url(self) -> str:
+        """Return the OAuth2 authorization endpoint for Azure AD B2C."""
+        return f"{self.authority_url}/oauth2/v2.0/authorize"
+    
+    @property
+    def token_url(self) -> str:
+        """Return the OAuth2 token endpoint for Azure AD B2C."""
+        return f"{self.authority_url}/oauth2/v2.0/token"
+    
     @property
     def cors_origins_list(self) -> List[str]:
         """Parse CORS_ORIGINS into a list, handling both string and list inputs."""
@@ -141,4 +156,15 @@ class Settings(BaseSettings):
     )
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the application settings.
+    
+    The environment and .env file are read once, on first call; every later
+    call returns the same instance.
+    """
+    return Settings()
+
+
+settings = get_settings()
@@ -80,15 +80,20 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         Exception: If session operations fail
     """
     session = AsyncSessionLocal()
+    # Checked once per session; these lines run on every request
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     try:
-        logger.debug("Creating new database session")
+        if debug_enabled:
+            logger.debug("Creating new database session")
         yield session
         await session.commit()
-        logger.debug("Database session committed")
+        if debug_enabled:
+            logger.debug("Database session committed")
     except Exception as e:
         logger.error("Database session error, rolling back", exc_info=e)
         await session.rollback()
         raise
     finally:
-        logger.debug("Closing database session")
+        if debug_enabled:
+            logger.debug("Closing database session")
         await session.close()
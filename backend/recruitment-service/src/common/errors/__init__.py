@@ -0,0 +1,34 @@
+import functools
+from typing import Any, Awaitable, Callable, TypeVar
+
+from fastapi import HTTPException
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+def handle_service_errors(action: str) -> Callable[[F], F]:
+    """
+    Convert unexpected errors raised by a route handler into HTTP 500 responses.
+    
+    HTTPExceptions pass through unchanged; any other exception becomes a 500
+    with detail "Failed to {action}: {error}".
+    
+    Args:
+        action: Short description of the operation, e.g. "upload resume"
+        
+    Returns:
+        Decorator for async route handlers
+    """
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"Failed to {action}: {str(e)}"
+                )
+        return wrapper  # type: ignore[return-value]
+    return decorator
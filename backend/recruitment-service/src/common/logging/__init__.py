@@ -1,6 +1,13 @@
+import atexit
 import logging
 import os
+import queue
+import random
+import threading
+import time
+import orjson
 import structlog
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional, List, Dict, Any
 
 from src.common.config import settings
@@ -14,6 +21,105 @@ LOG_LEVEL_MAP = {
     "CRITICAL": logging.CRITICAL,
 }
 
+# Background listener that formats and writes queued records
+_queue_listener: Optional[QueueListener] = None
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson, returning str for the stdlib handlers."""
+    return orjson.dumps(obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS).decode()
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only a sample of routine log records.
+    
+    Records at WARNING and above always pass so failures are never lost;
+    DEBUG and INFO records pass with probability ``sample_rate``.
+    """
+    
+    def __init__(self, sample_rate: float):
+        super().__init__()
+        self.sample_rate = sample_rate
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        return random.random() < self.sample_rate
+
+class RateLimitedStreamHandler(logging.StreamHandler):
+    """
+    Stream handler that caps output with a token bucket.
+    
+    DEBUG and INFO records beyond ``rate`` per second (with bursts up to one
+    second's worth, and never less than one record) are dropped and counted;
+    WARNING and above always pass, like in ``SamplingFilter``. The count is
+    reported in a single warning at most once per second, from a timer if no
+    further records arrive, and on close.
+    """
+    
+    def __init__(self, rate: float, stream=None):
+        super().__init__(stream)
+        self.rate = rate
+        # Rates below one per second still need room for a whole record
+        self.capacity = max(rate, 1.0)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.dropped = 0
+        self.last_report = self.last_refill
+        # Pending report of dropped records, if any were dropped since the last
+        self._report_timer: Optional[threading.Timer] = None
+    
+    def _report_dropped(self) -> None:
+        """Write the dropped-record count, if any; the caller holds self.lock."""
+        if self.dropped:
+            super().emit(logging.makeLogRecord({
+                "name": __name__,
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": "Dropped %d log records due to rate limiting",
+                "args": (self.dropped,),
+            }))
+            self.dropped = 0
+        self.last_report = time.monotonic()
+    
+    def _report_dropped_later(self) -> None:
+        """Timer callback reporting drops when no later record did."""
+        with self.lock:
+            self._report_timer = None
+            self._report_dropped()
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        # Handler.handle() holds self.lock around emit, so the bucket state
+        # is only ever touched by one thread at a time
+        if record.levelno >= logging.WARNING:
+            self._report_dropped()
+            super().emit(record)
+            return
+        
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+        
+        if self.tokens < 1:
+            self.dropped += 1
+            if self._report_timer is None:
+                self._report_timer = threading.Timer(
+                    max(0.0, 1.0 - (now - self.last_report)), self._report_dropped_later
+                )
+                self._report_timer.daemon = True
+                self._report_timer.start()
+            return
+        self.tokens -= 1
+        super().emit(record)
+    
+    def close(self) -> None:
+        """Report any records dropped since the last summary, then close."""
+        with self.lock:
+            if self._report_timer is not None:
+                self._report_timer.cancel()
+                self._report_timer = None
+            self._report_dropped()
+        super().close()
+
 def configure_logging(
     log_level: Optional[str] = None,
     log_format: Optional[str] = None
@@ -25,6 +131,8 @@ def configure_logging(
         log_level: Override log level (defaults to settings.LOG_LEVEL)
         log_format: Override log format (defaults to settings.LOG_FORMAT)
     """
+    global _queue_listener
+    
     # Use parameters or fall back to settings
     level = log_level or settings.LOG_LEVEL
     format_type = log_format or settings.LOG_FORMAT
@@ -37,15 +145,27 @@ def configure_logging(
     root_logger.setLevel(level_int)
     
     # Remove existing handlers to avoid duplicates
+    stop_logging()
     while root_logger.handlers:
         root_logger.removeHandler(root_logger.handlers[0])
     
     # Add console handler
-    console_handler = logging.StreamHandler()
+    if settings.LOG_MAX_RATE_PER_SECOND > 0:
+        console_handler = RateLimitedStreamHandler(settings.LOG_MAX_RATE_PER_SECOND)
+    else:
+        console_handler = logging.StreamHandler()
     console_handler.setLevel(level_int)
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    if settings.LOG_SAMPLE_RATE < 1.0:
+        console_handler.addFilter(SamplingFilter(settings.LOG_SAMPLE_RATE))
+    
+    # Format and write records on a background thread so callers, including
+    # the event loop, only pay for an enqueue
+    log_queue = queue.SimpleQueue()
+    _queue_listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _queue_listener.start()
+    root_logger.addHandler(QueueHandler(log_queue))
     
     # Set levels for key loggers
     configure_module_loggers(level_int)
@@ -64,7 +184,7 @@ def configure_logging(
     
     # Add the renderer based on format type
     if format_type.lower() == "json":
-        processors.append(structlog.processors.JSONRenderer())
+        processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
     else:
         processors.append(structlog.dev.ConsoleRenderer(colors=True))
     
@@ -85,6 +205,18 @@ def configure_logging(
         environment=settings.ENVIRONMENT
     )
 
+def stop_logging() -> None:
+    """Flush any queued log records, stop the background listener and close its handlers."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        # Closing lets the rate-limited handler report a final drop count
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+atexit.register(stop_logging)
+
 def configure_module_loggers(level_int: int) -> None:
     """
     Configure log levels for specific modules.
@@ -1,59 +1,159 @@
-from fastapi import Request
+import logging
+import secrets
 import time
 import structlog
-from typing import Callable
+from urllib.parse import parse_qsl
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = structlog.get_logger(__name__)
 
-async def request_logging_middleware(request: Request, call_next: Callable):
+# Pre-rendered liveness response, identical on every probe
+_HEALTH_BODY = b'{"status":"healthy"}'
+_HEALTH_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_HEALTH_BODY)).encode()),
+]
+
+def generate_request_id() -> str:
     """
-    Middleware to log all incoming requests and their responses.
+    Generate a request ID for requests that arrive without one.
+    
+    A hex nanosecond timestamp plus a random suffix is cheaper than uuid4 and
+    sorts by arrival time.
     
-    Args:
-        request: The FastAPI request
-        call_next: The next middleware or route handler
-        
     Returns:
-        The response from the next handler
+        The new request ID
     """
-    start_time = time.time()
-    
-    # Log request
-    logger.info(
-        "Request started",
-        method=request.method,
-        path=request.url.path,
-        query_params=dict(request.query_params),
-        client=request.client.host if request.client else "unknown",
-        request_id=request.headers.get("X-Request-ID", "none"),
-        auth_header_present="authorization" in [k.lower() for k in request.headers.keys()],
-        auth_bypass_present="x-auth-bypass" in [k.lower() for k in request.headers.keys()]
-    )
-    
-    # Process request
-    try:
-        response = await call_next(request)
-        
+    return f"{time.time_ns():x}{secrets.token_hex(4)}"
+
+class RequestLoggingMiddleware:
+    """
+    ASGI middleware to log all incoming requests and their responses.
+
+    Implemented as a plain ASGI callable rather than with BaseHTTPMiddleware,
+    which adds a task group and a Request object to every request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Log the request, pass it to the wrapped app, then log the outcome.
+
+        Args:
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
+        headers = dict(scope["headers"])
+        client = scope.get("client")
+        # Keep the ID as bytes for the response header and as str for logs,
+        # so neither form is re-encoded per response
+        request_id_bytes = headers.get(b"x-request-id")
+        if request_id_bytes:
+            request_id = request_id_bytes.decode("latin-1")
+        else:
+            request_id = generate_request_id()
+            request_id_bytes = request_id.encode("latin-1")
+
+        # Expose the ID to handlers further down via plain scope lookups
+        scope["request_id"] = request_id
+
+        # Skip building log fields when INFO is filtered out
+        info_enabled = logger.isEnabledFor(logging.INFO)
+
+        # Fields shared by every log line for this request, built once
+        fields = {"request_id": request_id, "method": method, "path": path}
+
+        # Log request; the completion line carries the same fields, so the
+        # start line is only emitted at DEBUG
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Request started",
+                **fields,
+                query_params=dict(parse_qsl(scope.get("query_string", b"").decode("latin-1"))),
+                client=client[0] if client else "unknown",
+                auth_header_present=b"authorization" in headers,
+                auth_bypass_present=b"x-auth-bypass" in headers
+            )
+
+        status_code = 500
+        process_time = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, process_time
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Time to response headers, measured once and shared by the
+                # X-Process-Time header and the completion log
+                process_time = (time.perf_counter() - start_time) * 1000
+                # Echo the request ID so clients can correlate with our logs
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"x-request-id", request_id_bytes),
+                    (b"x-process-time", f"{process_time:.2f}".encode()),
+                ]
+            await send(message)
+
+        # Process request
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            # Log exceptions that weren't caught by exception handlers
+            if process_time is None:
+                process_time = (time.perf_counter() - start_time) * 1000
+            logger.error(
+                "Request failed with unhandled error",
+                **fields,
+                error=str(e),
+                process_time_ms=round(process_time, 2),
+                exc_info=e
+            )
+            raise
+
         # Log response
-        process_time = (time.time() - start_time) * 1000
-        logger.info(
-            "Request completed",
-            method=request.method,
-            path=request.url.path,
-            status_code=response.status_code,
-            process_time_ms=round(process_time, 2)
-        )
-        
-        return response
-    except Exception as e:
-        # Log exceptions that weren't caught by exception handlers
-        process_time = (time.time() - start_time) * 1000
-        logger.error(
-            "Request failed with unhandled error",
-            method=request.method,
-            path=request.url.path,
-            error=str(e),
-            process_time_ms=round(process_time, 2),
-            exc_info=e
-        )
-        raise
+        if info_enabled:
+            if process_time is None:
+                process_time = (time.perf_counter() - start_time) * 1000
+            logger.info(
+                "Request completed",
+                **fields,
+                status_code=status_code,
+                process_time_ms=round(process_time, 2)
+            )
+
+class HealthCheckMiddleware:
+    """
+    ASGI middleware that answers GET /health before the rest of the stack.
+
+    Health checks are used by container orchestration and monitoring systems
+    and hit the service every few seconds, so they skip CORS, routing and
+    request logging entirely. Add it last so it is the outermost middleware.
+    """
+
+    def __init__(self, app: ASGIApp, path: str = "/health"):
+        self.app = app
+        self.path = path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Respond to health checks directly and pass everything else through.
+
+        Args:
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
+        """
+        if scope["type"] == "http" and scope["path"] == self.path and scope["method"] == "GET":
+            await send({"type": "http.response.start", "status": 200, "headers": _HEALTH_HEADERS})
+            await send({"type": "http.response.body", "body": _HEALTH_BODY})
+            return
+        await self.app(scope, receive, send)
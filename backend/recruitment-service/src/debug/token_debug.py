@@ -152,7 +152,7 @@ def base64_decode_segment(segment: str) -> Optional[str]:
             
         return base64.b64decode(segment).decode('utf-8')
     except Exception as e:
-        logger.warning(f"Failed to decode base64 segment: {str(e)}")
+        logger.warning("Failed to decode base64 segment", error=str(e))
         return None
 
 def get_auth_help_info() -> Dict[str, Any]:
@@ -167,8 +167,8 @@ def get_auth_help_info() -> Dict[str, Any]:
             "oauth2": {
                 "swagger_authorize": {
                     "client_id": settings.AZURE_AD_B2C_CLIENT_ID,
-                    "auth_url": f"https://{settings.AZURE_AD_B2C_TENANT_NAME}.b2clogin.com/{settings.AZURE_AD_B2C_TENANT_NAME}.onmicrosoft.com/{settings.AZURE_AD_B2C_SIGNIN_POLICY}/oauth2/v2.0/authorize",
-                    "token_url": f"https://{settings.AZURE_AD_B2C_TENANT_NAME}.b2clogin.com/{settings.AZURE_AD_B2C_TENANT_NAME}.onmicrosoft.com/{settings.AZURE_AD_B2C_SIGNIN_POLICY}/oauth2/v2.0/token",
+                    "auth_url": settings.authorization_url,
+                    "token_url": settings.token_url,
                     "scope": settings.azure_ad_b2c_scope
                 }
             },
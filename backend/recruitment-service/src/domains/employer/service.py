@@ -19,10 +19,13 @@ class EmployerService:
     Handles all business logic related to employers, departments, and teams.
     """
     
+    __slots__ = ("db",)
+    
+    logger = structlog.get_logger(__name__)
+    
     def __init__(self, db: AsyncSession):
         """Initialize the service with a database session."""
         self.db = db
-        self.logger = structlog.get_logger(__name__)
         
     async def create_employer(self, employer_data: EmployerCreate) -> Employer:
         """
@@ -44,7 +47,7 @@ class EmployerService:
         )
         
         try:
-            employer = Employer(**employer_data.dict())
+            employer = Employer(**employer_data.model_dump())
             self.db.add(employer)
             await self.db.commit()
             await self.db.refresh(employer)
@@ -146,7 +149,7 @@ class EmployerService:
         self.logger.info("Updating employer", employer_id=employer_id)
         
         # Remove None values to allow partial updates
-        update_data = {k: v for k, v in employer_data.dict().items() if v is not None}
+        update_data = {k: v for k, v in employer_data.model_dump().items() if v is not None}
         
         if not update_data:
             self.logger.debug("No update needed, all fields are None")
@@ -251,7 +254,7 @@ class EmployerService:
                 self.logger.warning("Employer not found for department creation", employer_id=employer_id)
                 raise HTTPException(status_code=404, detail="Employer not found")
                 
-            department = Department(employer_id=employer_id, **department_data.dict())
+            department = Department(employer_id=employer_id, **department_data.model_dump())
             self.db.add(department)
             await self.db.commit()
             await self.db.refresh(department)
@@ -322,7 +325,7 @@ class EmployerService:
                     )
                     raise HTTPException(status_code=404, detail="Department not found")
                     
-            team = Team(employer_id=employer_id, **team_data.dict())
+            team = Team(employer_id=employer_id, **team_data.model_dump())
             self.db.add(team)
             await self.db.commit()
             await self.db.refresh(team)
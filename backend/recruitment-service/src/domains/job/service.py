@@ -22,10 +22,13 @@ class JobService:
     creation, updates, publishing, and deletion.
     """
     
+    __slots__ = ("db",)
+    
+    logger = structlog.get_logger(__name__)
+    
     def __init__(self, db: AsyncSession):
         """Initialize the service with a database session."""
         self.db = db
-        self.logger = structlog.get_logger(__name__)
         
     async def create_job(self, job_data: JobCreate) -> Job:
         """
@@ -48,7 +51,7 @@ class JobService:
         )
         
         try:
-            job = Job(**job_data.dict())
+            job = Job(**job_data.model_dump())
             self.db.add(job)
             await self.db.commit()
             await self.db.refresh(job)
@@ -203,7 +206,7 @@ class JobService:
         self.logger.info("Updating job", job_id=job_id)
         
         # Remove None values to allow partial updates
-        update_data = {k: v for k, v in job_data.dict().items() if v is not None}
+        update_data = {k: v for k, v in job_data.model_dump().items() if v is not None}
         
         if not update_data:
             self.logger.debug("No update needed, all fields are None")
@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
 from src.common.db.database import get_db
+from src.common.errors import handle_service_errors
 from src.domains.job.models import JobPublishingChannel, PublishingChannelRead, PublishingChannelCreate
 from src.domains.publishing.service import PublishingService
 
@@ -10,6 +11,7 @@ router = APIRouter()
 
 
 @router.post("/jobs/{job_id}/channels", response_model=PublishingChannelRead)
+@handle_service_errors("add publishing channel")
 async def add_publishing_channel(
     job_id: str,
     channel_data: PublishingChannelCreate,
@@ -17,15 +19,7 @@ async def add_publishing_channel(
 ):
     """Add a publishing channel to a job."""
     service = PublishingService(db)
-    try:
-        return await service.add_channel(job_id, channel_data)
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to add publishing channel: {str(e)}"
-        )
+    return await service.add_channel(job_id, channel_data)
 
 
 @router.get("/jobs/{job_id}/channels", response_model=List[PublishingChannelRead])
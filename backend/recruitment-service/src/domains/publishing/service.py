@@ -19,10 +19,13 @@ class PublishingService:
     to various external platforms.
     """
     
+    __slots__ = ("db",)
+    
+    logger = structlog.get_logger(__name__)
+    
     def __init__(self, db: AsyncSession):
         """Initialize the service with a database session."""
         self.db = db
-        self.logger = structlog.get_logger(__name__)
         
     async def add_channel(self, job_id: str, channel_data: PublishingChannelCreate) -> JobPublishingChannel:
         """
@@ -58,7 +61,7 @@ class PublishingService:
             # Create channel
             channel = JobPublishingChannel(
                 job_id=job_id,
-                **channel_data.dict()
+                **channel_data.model_dump()
             )
             
             self.db.add(channel)
@@ -16,10 +16,13 @@ class ScreeningService:
     and other candidate evaluation activities.
     """
     
+    __slots__ = ("db",)
+    
+    logger = structlog.get_logger(__name__)
+    
     def __init__(self, db: AsyncSession):
         """Initialize the service with a database session."""
         self.db = db
-        self.logger = structlog.get_logger(__name__)
         
     async def upload_resume(
         self, 
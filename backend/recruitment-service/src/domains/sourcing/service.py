@@ -16,10 +16,13 @@ class SourcingService:
     and automation of candidate acquisition activities.
     """
     
+    __slots__ = ("db",)
+    
+    logger = structlog.get_logger(__name__)
+    
     def __init__(self, db: AsyncSession):
         """Initialize the service with a database session."""
         self.db = db
-        self.logger = structlog.get_logger(__name__)
         
     async def start_candidate_sourcing(self, job_id: str, search_criteria: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -1,8 +1,8 @@
 import logging
 from contextlib import asynccontextmanager
 
-# Import our centralized logging configuration
-from src.common.logging import configure_logging, get_logger
+# Import our centralized logging configuration; importing it configures logging
+from src.common.logging import get_logger
 import structlog  # Add the missing import
 from fastapi import FastAPI, HTTPException, Request, Depends, Security
 from fastapi.middleware.cors import CORSMiddleware
@@ -12,7 +12,6 @@ from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 from fastapi.openapi.utils import get_openapi
 from pathlib import Path
 import os
-from jose import jwt
 
 from src.common.config import settings
 from src.common.db.database import init_db
@@ -24,14 +23,14 @@ from src.domains.screening.router import router as screening_router
 from src.domains.sourcing.router import router as sourcing_router
 from src.common.websocket.handlers import handle_job_event, handle_screening_event, handle_sourcing_event
 from src.websocket.routes import router as websocket_router
-from src.common.middleware import request_logging_middleware
-
-# Configure logging using our centralized module
-configure_logging(settings.LOG_LEVEL, settings.LOG_FORMAT)
+from src.common.middleware import HealthCheckMiddleware, RequestLoggingMiddleware
 
 # Get a logger for this module
 logger = get_logger(__name__)
 
+# Resolved once at import; the environment does not change at runtime
+_IS_DEV = settings.ENVIRONMENT == "development"
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -108,11 +107,6 @@ app = FastAPI(
     }
 )
 
-# Remove the request logging middleware (since it was just for debugging)
-# @app.middleware("http")
-# async def log_requests(request: Request, call_next):
-#     return await request_logging_middleware(request, call_next)
-
 # Add development mode auth bypass info to description if in development
 if settings.ENVIRONMENT in ["development", "testing"]:
     app.description += """
@@ -135,8 +129,17 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Request-ID", "X-Process-Time"],
 )
 
+# Log every request with a request ID and timing, echoed back as the
+# X-Request-ID and X-Process-Time response headers
+app.add_middleware(RequestLoggingMiddleware)
+
+# Answer health checks before any other middleware runs; added last so it
+# wraps the whole stack
+app.add_middleware(HealthCheckMiddleware)
+
 # Include routers from all domains
 app.include_router(employer_router, prefix="/api/employer", tags=["Employer"])
 app.include_router(job_router, prefix="/api/jobs", tags=["Jobs"])
@@ -152,7 +155,8 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     logger.info("HTTP exception", 
                 status_code=exc.status_code, 
                 detail=exc.detail, 
-                path=request.url.path)
+                path=request.url.path,
+                request_id=request.scope.get("request_id"))
     return JSONResponse(
         status_code=exc.status_code, 
         content={"detail": exc.detail},
@@ -164,98 +168,81 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     logger.warning("Validation error", 
                   errors=exc.errors(),
                   body=str(await request.body()),
-                  path=request.url.path)
+                  path=request.url.path,
+                  request_id=request.scope.get("request_id"))
     return JSONResponse(
         status_code=422,
         content={"detail": exc.errors()},
     )
 
-@app.get("/health", include_in_schema=False)
-async def health_check():
-    """
-    Health check endpoint.
-    Returns a simple status response to indicate the service is running.
-    Used by container orchestration and monitoring systems.
-    """
-    logger.debug("Health check requested")
-    return {"status": "healthy"}
+# Debug endpoints are only registered in development so they never reach the
+# route table in other environments
+if _IS_DEV:
+    # Enhanced token debugging endpoint
+    @app.get("/debug/token-info", include_in_schema=False)
+    async def token_info(request: Request):
+        """
+        Debug endpoint to check token information.
+        Only available in development mode.
+        """
+        from src.debug.token_debug import get_auth_debug_info
+        return get_auth_debug_info(request)
 
-# Enhanced token debugging endpoint
-@app.get("/debug/token-info", include_in_schema=False)
-async def token_info(request: Request):
-    """
-    Debug endpoint to check token information.
-    Only available in development mode.
-    """
-    if settings.ENVIRONMENT != "development":
-        raise HTTPException(status_code=404, detail="Not found")
-    
-    from src.debug.token_debug import get_auth_debug_info
-    return get_auth_debug_info(request)
 
+    @app.get("/debug/auth-test", include_in_schema=False)
+    async def auth_test(request: Request):
+        """
+        Debug endpoint that requires authentication.
+        Only available in development mode.
+        """
+        state = request.state
+        return {
+            "authenticated": True,
+            "user": getattr(state, "user", None),
+            "user_id": getattr(state, "user_id", None),
+            "roles": getattr(state, "roles", None),
+        }
 
-@app.get("/debug/auth-test", include_in_schema=False)
-async def auth_test(request: Request):
-    """
-    Debug endpoint that requires authentication.
-    Only available in development mode.
-    """
-    if settings.ENVIRONMENT != "development":
-        raise HTTPException(status_code=404, detail="Not found")
-        
-    return {
-        "authenticated": True,
-        "user": request.state.user if hasattr(request.state, "user") else None,
-        "user_id": request.state.user_id if hasattr(request.state, "user_id") else None,
-        "roles": request.state.roles if hasattr(request.state, "roles") else None,
-    }
+    # Add authentication help endpoint for development
+    @app.get("/debug/auth-help", include_in_schema=False)
+    async def auth_help_endpoint():
+        """
+        Debug endpoint providing authentication help.
+        Only available in development mode.
+        """
+        from src.debug.token_debug import get_auth_help_info
 
-# Add authentication help endpoint for development
-@app.get("/debug/auth-help", include_in_schema=False)
-async def auth_help_endpoint():
-    """
-    Debug endpoint providing authentication help.
-    Only available in development mode.
-    """
-    if settings.ENVIRONMENT != "development":
-        raise HTTPException(status_code=404, detail="Not found")
-        
-    from src.debug.token_debug import get_auth_help_info
-    
-    return get_auth_help_info()
+        return get_auth_help_info()
 
-# Add a logging debug endpoint
-@app.get("/debug/logging-test", include_in_schema=False)
-async def debug_logging_test():
-    """
-    Debug endpoint to test different logging methods.
-    Only available in development mode.
-    """
-    if settings.ENVIRONMENT != "development":
-        raise HTTPException(status_code=404, detail="Not found")
-    
-    from src.debug.token_debug import get_logging_debug_info, test_logging_methods
-    
-    # Run the logging tests
-    test_results = test_logging_methods()
-    
-    # Get logging config info
-    logging_info = get_logging_debug_info()
-    
-    # Add some direct logging from this endpoint
-    py_logger = logging.getLogger("src.main")
-    py_logger.info("Direct Python logger INFO from debug endpoint")
-    
-    struct_logger = structlog.get_logger("src.main")
-    struct_logger.info("Structlog INFO from debug endpoint")
-    
-    print("[DEBUG] Direct print from debug endpoint")
-    
-    return {
-        "test_results": test_results,
-        "logging_info": logging_info,
-        "note": "Check your console for logged messages"
-    }
+    # Add a logging debug endpoint
+    @app.get("/debug/logging-test", include_in_schema=False)
+    async def debug_logging_test():
+        """
+        Debug endpoint to test different logging methods.
+        Only available in development mode.
+        """
+        from src.debug.token_debug import get_logging_debug_info, test_logging_methods
+
+        # Run the logging tests
+        test_results = test_logging_methods()
+
+        # Get logging config info
+        logging_info = get_logging_debug_info()
+
+        # Add some direct logging from this endpoint
+        py_logger = logging.getLogger("src.main")
+        py_logger.info("Direct Python logger INFO from debug endpoint")
+
+        struct_logger = structlog.get_logger("src.main")
+        struct_logger.info("Structlog INFO from debug endpoint")
+
+        print("[DEBUG] Direct print from debug endpoint")
+
+        return {
+            "test_results": test_results,
+            "logging_info": logging_info,
+            "note": "Check your console for logged messages"
+        }
 
 # Custom OpenAPI to include security definitions
 def custom_openapi():
@@ -279,8 +266,8 @@ def custom_openapi():
             "type": "oauth2",
             "flows": {
                 "authorizationCode": {
-                    "authorizationUrl": f"https://{settings.AZURE_AD_B2C_TENANT_NAME}.b2clogin.com/{settings.AZURE_AD_B2C_TENANT_NAME}.onmicrosoft.com/{settings.AZURE_AD_B2C_SIGNIN_POLICY}/oauth2/v2.0/authorize",
-                    "tokenUrl": f"https://{settings.AZURE_AD_B2C_TENANT_NAME}.b2clogin.com/{settings.AZURE_AD_B2C_TENANT_NAME}.onmicrosoft.com/{settings.AZURE_AD_B2C_SIGNIN_POLICY}/oauth2/v2.0/token",
+                    "authorizationUrl": settings.authorization_url,
+                    "tokenUrl": settings.token_url,
                     "scopes": {
                         "openid": "OpenID Connect authentication",
                         settings.azure_ad_b2c_scope: "Access API"
@@ -1,11 +1,13 @@
 import asyncio
+import json
+import jwt
 from typing import Dict, Set, List, Any, Optional
 import structlog
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query, Depends
-from jose import jwt, JWTError
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Header
+from jwt.algorithms import get_default_algorithms
 
-# Updated import - use auth module directly instead of middleware
-from src.common.auth.dependencies import get_current_user
+from src.common.auth.bypass import BYPASS_USER_CLAIMS, is_valid_bypass
+from src.common.auth.token_cache import TokenCache
 from src.common.config import settings
 
 router = APIRouter()
@@ -14,26 +16,60 @@ logger = structlog.get_logger(__name__)
 # Store active connections
 active_connections: Dict[str, Set[WebSocket]] = {}
 
+# Accepted signing algorithms, built once rather than on every handshake.
+# Reject unknown algorithms, and unsigned "none" tokens, at startup instead
+# of failing every handshake.
+if settings.AUTH_ALGORITHM.lower() == "none" or settings.AUTH_ALGORITHM not in get_default_algorithms():
+    raise ValueError(f"Unsupported AUTH_ALGORITHM: {settings.AUTH_ALGORITHM}")
+_AUTH_ALGORITHMS = [settings.AUTH_ALGORITHM]
+
+# Recently decoded tokens, so reconnects with the same token skip signature
+# verification until the cache TTL or the token's expiry
+_token_cache = TokenCache(
+    maxsize=settings.AUTH_TOKEN_CACHE_MAX_SIZE,
+    ttl=settings.AUTH_TOKEN_CACHE_TTL_SECONDS,
+)
+
+# Clients authenticate by offering this subprotocol followed by their token,
+# e.g. new WebSocket(url, ["bearer", token]), which keeps the token out of
+# the URL and therefore out of access logs.
+WS_AUTH_SUBPROTOCOL = "bearer"
+
+# Welcome frame sent on connect; only job_id varies, so the rest is
+# serialized once here and job_id is JSON-escaped into it per connection
+_JOB_WELCOME_TEMPLATE = (
+    '{"type":"connection_established","job_id":%s,'
+    '"message":"Connected to job updates"}'
+)
+
+def extract_subprotocol_token(protocols: Optional[str]) -> Optional[str]:
+    """Extract the auth token from a Sec-WebSocket-Protocol header value."""
+    if not protocols:
+        return None
+    offered = [protocol.strip() for protocol in protocols.split(",")]
+    if len(offered) == 2 and offered[0] == WS_AUTH_SUBPROTOCOL:
+        return offered[1]
+    return None
+
 async def verify_token(token: str) -> Optional[Dict[str, Any]]:
     """Verify the authentication token for WebSocket connections."""
     try:
         # Simple validation for development mode bypass
-        if (settings.ENVIRONMENT in ["development", "testing"] and 
-            settings.AUTH_BYPASS_ENABLED and 
-            token == settings.AUTH_BYPASS_TOKEN):
+        if is_valid_bypass(token):
             logger.warning("WebSocket authentication bypassed with token")
-            return {
-                "sub": "test-user-id",
-                "name": "Test User",
-                "roles": ["admin"]
-            }
+            return BYPASS_USER_CLAIMS
+            
+        payload = _token_cache.get(token)
+        if payload is not None:
+            return payload
             
         # For production, perform actual token validation here
         # This is a simplified implementation
         # In a real app, you'd use proper token validation
-        payload = jwt.decode(token, settings.AUTH_SECRET_KEY, algorithms=[settings.AUTH_ALGORITHM])
+        payload = jwt.decode(token, settings.AUTH_SECRET_KEY, algorithms=_AUTH_ALGORITHMS)
+        _token_cache.set(token, payload, exp=payload.get("exp"))
         return payload
-    except JWTError as e:
+    except jwt.PyJWTError as e:
         logger.warning("WebSocket auth failed", error=str(e))
         return None
     except Exception as e:
@@ -79,18 +115,19 @@ async def send_message_safe(websocket: WebSocket, message: Dict[str, Any]) -> No
 async def websocket_job_endpoint(
     websocket: WebSocket, 
     job_id: str,
-    token: str = Query(...)
+    protocols: Optional[str] = Header(default=None, alias="sec-websocket-protocol")
 ):
     """WebSocket endpoint for real-time job updates."""
     # Verify token
-    user = await verify_token(token)
+    token = extract_subprotocol_token(protocols)
+    user = await verify_token(token) if token else None
     if not user:
         logger.warning("WebSocket connection rejected - invalid token", job_id=job_id)
         await websocket.close(code=1008)  # Policy violation
         return
         
-    # Accept the connection
-    await websocket.accept()
+    # Accept the connection, echoing the auth subprotocol back to the client
+    await websocket.accept(subprotocol=WS_AUTH_SUBPROTOCOL)
     
     # Register connection
     channel = f"job:{job_id}"
@@ -106,11 +143,7 @@ async def websocket_job_endpoint(
     
     try:
         # Send initial status message
-        await websocket.send_json({
-            "type": "connection_established",
-            "job_id": job_id,
-            "message": "Connected to job updates"
-        })
+        await websocket.send_text(_JOB_WELCOME_TEMPLATE % json.dumps(job_id))
         
         # Listen for messages
         while True:
@@ -137,17 +170,18 @@ async def websocket_job_endpoint(
 async def websocket_screening_endpoint(
     websocket: WebSocket, 
     job_id: str,
-    token: str = Query(...)
+    protocols: Optional[str] = Header(default=None, alias="sec-websocket-protocol")
 ):
     """WebSocket endpoint for real-time screening updates."""
     # Similar implementation as websocket_job_endpoint
     # ...
     # Simplified for brevity
-    user = await verify_token(token)
+    token = extract_subprotocol_token(protocols)
+    user = await verify_token(token) if token else None
     if not user:
         await websocket.close(code=1008)
         return
         
-    await websocket.accept()
+    await websocket.accept(subprotocol=WS_AUTH_SUBPROTOCOL)
     channel = f"screening:{job_id}"
     # ...rest of implementation
@@ -6,22 +6,30 @@ This script securely fetches development secrets from Azure Key Vault
 and creates appropriate .env files for local development.
 
 Requirements:
-- Azure CLI installed and logged in
+- azure-identity and azure-keyvault-secrets installed
+  (pip install azure-identity azure-keyvault-secrets)
+- Azure credentials available, e.g. by logging in with the Azure CLI
 - Appropriate access to the development Key Vault
 
 Usage:
     python setup-env.py --service recruitment
+    python setup-env.py --service recruitment --refresh
 """
 
 import argparse
 import os
-import subprocess
+import re
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from getpass import getpass
 
 # Configuration
 KEY_VAULT_NAME = "cognitivehire-dev-kv"
+KEY_VAULT_URL = f"https://{KEY_VAULT_NAME}.vault.azure.net"
+KEY_VAULT_SCOPE = "https://vault.azure.net/.default"
+# Secrets are fetched concurrently; each fetch mostly waits on the network
+MAX_FETCH_WORKERS = 8
 SERVICES = {
     "recruitment": {
         "path": "backend/recruitment-service/.env",
@@ -46,38 +54,93 @@ SERVICES = {
     # Add other services as needed
 }
 
+# Shared across calls so credentials are resolved and tokens fetched once
+_credential = None
+_secret_client = None
+
+# The Azure SDK is imported only when secrets must be fetched, so --help and
+# runs that reuse an existing .env work without it
+def has_azure_sdk():
+    """Check that the Azure SDK packages needed for Key Vault are installed"""
+    try:
+        import azure.identity
+        import azure.keyvault.secrets
+    except ImportError:
+        return False
+    return True
+
+def get_credential():
+    """Return the Azure credential shared by all Key Vault calls"""
+    global _credential
+    if _credential is None:
+        from azure.identity import DefaultAzureCredential
+        _credential = DefaultAzureCredential()
+    return _credential
+
+def get_secret_client():
+    """Return the Key Vault client shared by all secret fetches"""
+    global _secret_client
+    if _secret_client is None:
+        from azure.keyvault.secrets import SecretClient
+        _secret_client = SecretClient(vault_url=KEY_VAULT_URL, credential=get_credential())
+    return _secret_client
+
+def has_azure_cli_login():
+    """Check the Azure CLI profile for an enabled default subscription"""
+    profile_path = Path.home() / ".azure" / "azureProfile.json"
+    try:
+        # The CLI writes this file with a BOM
+        profile = json.loads(profile_path.read_text(encoding="utf-8-sig"))
+    except (OSError, ValueError):
+        return False
+    return any(
+        subscription.get("isDefault") and subscription.get("state") == "Enabled"
+        for subscription in profile.get("subscriptions", [])
+    )
+
 def check_azure_login():
-    """Check if user is logged in to Azure CLI"""
+    """Check if Azure credentials are available for Key Vault"""
+    # Reading the CLI profile avoids requesting a token just for this check;
+    # other credential types still need the token request
+    if has_azure_cli_login():
+        return True
     try:
-        result = subprocess.run(
-            ["az", "account", "show"], 
-            capture_output=True, 
-            text=True
-        )
-        return result.returncode == 0
+        get_credential().get_token(KEY_VAULT_SCOPE)
+        return True
     except Exception:
         return False
 
 def get_secret_from_keyvault(secret_name):
     """Fetch a secret from Azure Key Vault"""
+    from azure.core.exceptions import AzureError
     try:
-        result = subprocess.run(
-            ["az", "keyvault", "secret", "show", "--vault-name", KEY_VAULT_NAME, 
-             "--name", secret_name, "--query", "value", "-o", "tsv"],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-        else:
-            print(f"Error fetching secret {secret_name}: {result.stderr}")
-            return None
+        return get_secret_client().get_secret(secret_name).value
+    except AzureError as e:
+        print(f"Error fetching secret {secret_name}: {str(e)}")
+        return None
     except Exception as e:
         print(f"Error accessing Key Vault: {str(e)}")
         return None
 
-def create_env_file(service_name):
-    """Create .env file for a service from example and Key Vault secrets"""
+def read_existing_values(env_path):
+    """Read KEY=value pairs from an existing .env file"""
+    values = {}
+    if not os.path.exists(env_path):
+        return values
+    with open(env_path, "r") as f:
+        for line in f:
+            key, sep, value = line.strip().partition("=")
+            if sep and not key.startswith("#"):
+                values[key] = value
+    return values
+
+def create_env_file(service_name, refresh=False):
+    """
+    Create .env file for a service from example and Key Vault secrets.
+    
+    Secrets already set in an existing .env file are reused, so re-runs only
+    contact Key Vault for missing values. Pass refresh=True to fetch them all.
+    """
     service_config = SERVICES.get(service_name)
     if not service_config:
         print(f"Unknown service: {service_name}")
@@ -96,38 +159,89 @@ def create_env_file(service_name):
     with open(example_path, "r") as f:
         example_content = f.read()
     
-    # Replace secrets with actual values
-    env_content = example_content
+    # Only secrets with a KEY= line in the example can be written
+    example_values = read_existing_values(example_path)
+    secrets = []
     for secret_name in service_config["secrets"]:
         # Convert from KEY-VAULT-FORMAT to ENV_FILE_FORMAT
+        if secret_name.replace("-", "_") in example_values:
+            secrets.append(secret_name)
+        else:
+            print(f"Warning: {secret_name} has no line in {example_path}; skipping")
+    
+    # Reuse secrets from a previous run unless a refresh was requested. A
+    # value still equal to the example's default was never set, so it is
+    # fetched rather than reused
+    existing_values = {} if refresh else read_existing_values(service_path)
+    secret_values = {}
+    for secret_name in secrets:
         env_var = secret_name.replace("-", "_")
-        
-        # Get the secret value
-        secret_value = get_secret_from_keyvault(secret_name)
-        if secret_value:
-            # Replace the placeholder with the actual value
-            placeholder = f"{env_var}=your-{env_var.lower()}-here"
-            env_content = env_content.replace(placeholder, f"{env_var}={secret_value}")
+        value = existing_values.get(env_var)
+        if value and value != example_values[env_var]:
+            secret_values[secret_name] = value
+    reused = set(secret_values)
+    
+    # Fetch the remaining secrets at once rather than one after another
+    missing = [name for name in secrets if name not in secret_values]
+    failed = []
+    if missing:
+        if not has_azure_sdk():
+            print("Azure SDK not found. Run 'pip install azure-identity azure-keyvault-secrets'")
+            return False
+        if not check_azure_login():
+            print("No Azure credentials found. Run 'az login' first")
+            return False
+        # Create the shared client before the workers start; creating it
+        # lazily inside them would give each worker its own client and token
+        get_secret_client()
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(missing))) as executor:
+            for secret_name, secret_value in zip(missing, executor.map(get_secret_from_keyvault, missing)):
+                if secret_value:
+                    secret_values[secret_name] = secret_value
+                else:
+                    failed.append(secret_name)
+    
+    # Map each variable name to its new value
+    replacements = {
+        secret_name.replace("-", "_"): secret_value
+        for secret_name, secret_value in secret_values.items()
+    }
+    
+    # Replace the example's KEY=value line for every secret in a single
+    # pass, recording which variables were actually written
+    env_content = example_content
+    written = set()
+    
+    def replace_line(match):
+        written.add(match.group(1))
+        return f"{match.group(1)}={replacements[match.group(1)]}"
+    
+    if replacements:
+        pattern = re.compile(rf"^({'|'.join(map(re.escape, replacements))})=.*$", re.M)
+        env_content = pattern.sub(replace_line, example_content)
             
     # Write .env file
     with open(service_path, "w") as f:
         f.write(env_content)
         
-    print(f"Created .env file for {service_name} with secrets from Key Vault")
+    reused_written = sum(1 for name in reused if name.replace("-", "_") in written)
+    print(f"Created .env file for {service_name} "
+          f"({len(written) - reused_written} secrets written from Key Vault, {reused_written} reused)")
+    
+    # Failed secrets keep their placeholders; a re-run fetches only those
+    if failed:
+        print(f"Warning: could not fetch {', '.join(failed)}; re-run to retry")
+        return False
     return True
 
 def main():
     parser = argparse.ArgumentParser(description="Set up environment variables for local development")
     parser.add_argument("--service", required=True, help="Service to set up (recruitment, candidate, etc.)")
+    parser.add_argument("--refresh", action="store_true", help="Fetch all secrets again instead of reusing the existing .env values")
     args = parser.parse_args()
     
-    # Check Azure login
-    if not check_azure_login():
-        print("You need to log in to Azure CLI first. Run 'az login'")
-        return
-    
-    # Create .env file
-    create_env_file(args.service)
+    # Create .env file; Azure login is only checked if secrets need fetching
+    create_env_file(args.service, refresh=args.refresh)
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,11 @@
 #!/usr/bin/env python
 """Verify that required Python packages are installed correctly."""
 
+import argparse
 import importlib
 import sys
 import subprocess
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
 # Packages to verify
@@ -14,44 +16,63 @@ CRITICAL_PACKAGES = [
     "pydantic"
 ]
 
-def check_package(package_name):
-    """Check if a package can be imported."""
+def check_package(package_name, import_check=False):
+    """
+    Check if a package is installed.
+    
+    Reads the installed distribution metadata, which is much cheaper than
+    importing the package. With import_check, also import it to catch
+    broken installs.
+    """
     try:
-        importlib.import_module(package_name)
-        print(f"✅ {package_name} is installed and importable")
-        return True
-    except ImportError:
-        print(f"❌ {package_name} CANNOT be imported")
+        package_version = version(package_name)
+    except PackageNotFoundError:
+        print(f"❌ {package_name} is NOT installed")
         return False
+    
+    if import_check:
+        try:
+            importlib.import_module(package_name)
+        except ImportError:
+            print(f"❌ {package_name} {package_version} is installed but CANNOT be imported")
+            return False
+        print(f"✅ {package_name} {package_version} is installed and importable")
+    else:
+        print(f"✅ {package_name} {package_version} is installed")
+    return True
 
-def install_package(package_name):
-    """Try to install a package."""
-    print(f"🔧 Installing {package_name}...")
+def install_packages(package_names):
+    """Try to install packages with a single pip run so dependencies resolve once."""
+    print(f"🔧 Installing {', '.join(package_names)}...")
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package_name])
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *package_names])
         return True
     except subprocess.CalledProcessError:
         return False
 
 def main():
     """Main function."""
+    parser = argparse.ArgumentParser(description="Verify that required Python packages are installed")
+    parser.add_argument("--import-check", action="store_true", help="Also import each package to catch broken installs")
+    args = parser.parse_args()
+    
     print("Checking critical packages...")
     
     failed_packages = []
     for package in CRITICAL_PACKAGES:
-        if not check_package(package):
+        if not check_package(package, args.import_check):
             failed_packages.append(package)
     
     if failed_packages:
-        print("\n⚠️  Some packages failed to import. Attempting to install them...")
-        for package in failed_packages:
-            if install_package(package):
-                if check_package(package):
-                    print(f"✅ {package} was successfully installed and is now importable")
+        print("\n⚠️  Some packages failed the check. Attempting to install them...")
+        if install_packages(failed_packages):
+            for package in failed_packages:
+                if check_package(package, args.import_check):
+                    print(f"✅ {package} was successfully installed")
                 else:
-                    print(f"⚠️ {package} was installed but still can't be imported")
-            else:
-                print(f"❌ Failed to install {package}")
+                    print(f"⚠️ {package} was installed but still fails the check")
+        else:
+            print(f"❌ Failed to install {', '.join(failed_packages)}")
     
     # Check if we're in a virtual environment
     if hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):